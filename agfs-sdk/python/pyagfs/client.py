@@ -485,13 +485,18 @@ class AGFSClient:
 
     def truncate(self, path: str, size: int) -> Dict[str, Any]:
         """Truncate file to specified size
-        
+
+        The resize happens entirely on the server: only the path and size
+        are sent, never file data, so extending a file costs the same single
+        request however large the gap. Backends with native truncate (e.g.
+        localfs) extend sparsely.
+
         Args:
             path: File path
             size: Target size in bytes. If size is less than current size,
-                  extra data is discarded. If size is greater, file is 
+                  extra data is discarded. If size is greater, file is
                   extended with null bytes.
-        
+
         Returns:
             Response dict with message
         """
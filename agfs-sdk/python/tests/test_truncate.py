@@ -0,0 +1,35 @@
+"""
+Tests for ``AGFSClient.truncate``.
+
+The HTTP session is replaced with a ``MagicMock`` so no server is
+needed; each test inspects the requests the client issued.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from pyagfs import AGFSClient
+
+
+def _ok_response():
+    resp = MagicMock()
+    resp.json.return_value = {"message": "truncated"}
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+class TestTruncate:
+    """``truncate`` is a metadata-only request, whatever the target size."""
+
+    def test_extension_sends_no_file_data(self):
+        c = AGFSClient(api_base_url="http://example.invalid")
+        c.session = MagicMock()
+        c.session.post.return_value = _ok_response()
+
+        c.truncate("/big.bin", 10 * 1024 ** 3)
+
+        c.session.post.assert_called_once()
+        kwargs = c.session.post.call_args.kwargs
+        assert kwargs["params"] == {"path": "/big.bin", "size": str(10 * 1024 ** 3)}
+        assert "data" not in kwargs and "json" not in kwargs
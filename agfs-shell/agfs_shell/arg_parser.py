@@ -88,9 +88,10 @@ class StandardArgParser:
         remaining = []
 
         i = 0
+        n = len(args)
         end_of_options = False
 
-        while i < len(args):
+        while i < n:
             arg = args[i]
 
             # Check for end-of-options marker
@@ -106,38 +107,30 @@ class StandardArgParser:
                 continue
 
             # Check for options and flags
-            if arg.startswith('-') and len(arg) > 1:
+            if arg[:1] == '-' and len(arg) > 1:
+                is_long = arg[:2] == '--'
                 # Long option with value: --name=value
-                if arg.startswith('--') and '=' in arg:
+                if is_long and '=' in arg:
                     name, value = arg.split('=', 1)
                     options[name] = value
                     i += 1
-                # Long option requiring next arg: --count 10
-                elif arg.startswith('--') and arg in self.known_options:
-                    if i + 1 < len(args):
-                        options[arg] = args[i + 1]
-                        i += 2
-                    else:
-                        # Option without value - treat as flag
-                        flags.add(arg)
-                        i += 1
-                # Short option requiring next arg: -n 10
+                # Option requiring next arg: -n 10, --count 10
                 elif arg in self.known_options:
-                    if i + 1 < len(args):
+                    if i + 1 < n:
                         options[arg] = args[i + 1]
                         i += 2
                     else:
                         # Option without value - treat as flag
                         flags.add(arg)
                         i += 1
+                # Long flag: --verbose
+                elif is_long:
+                    flags.add(arg)
+                    i += 1
                 # Combined short flags: -lh or individual flag -l
                 else:
-                    # Try to split combined flags
-                    if not arg.startswith('--'):
-                        for char in arg[1:]:
-                            flags.add(f'-{char}')
-                    else:
-                        flags.add(arg)
+                    for char in arg[1:]:
+                        flags.add(f'-{char}')
                     i += 1
             else:
                 # Positional argument
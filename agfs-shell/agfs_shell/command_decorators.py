@@ -1,6 +1,5 @@
 """Command metadata and decorator system for agfs-shell"""
 
-from functools import wraps
 from typing import Optional, Set, Callable
 
 
@@ -127,12 +126,9 @@ def command(
             'path_arg_indices': path_arg_indices,
         }
 
+        # Metadata lives in the registry, so the function is returned as-is
+        # rather than behind a pass-through wrapper
         CommandMetadata.register(func, **metadata)
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-
-        return wrapper
+        return func
 
     return decorator
@@ -6,11 +6,26 @@ Variables and functions defined in the sourced file persist in the current shell
 """
 
 import os
+from functools import lru_cache
 from ..process import Process
 from ..command_decorators import command
 from . import register_command
 
 
+@lru_cache(maxsize=1024)
+def _resolve_source_path(cwd: str, filename: str) -> str:
+    """Resolve FILENAME against CWD (cached, rc files are sourced repeatedly)"""
+    if filename.startswith('/'):
+        return filename
+    # Relative path - resolve from current directory
+    joined = cwd + filename if cwd.endswith('/') else cwd + '/' + filename
+    # Only normalize when there is something to collapse ('.', '..', '//',
+    # trailing '/'); plain names like 'lib.sh' are already normal
+    if '/.' in joined or '//' in joined or joined.endswith('/'):
+        return os.path.normpath(joined)
+    return joined
+
+
 @command()
 @register_command('source', '.')
 def cmd_source(process: Process) -> int:
@@ -23,6 +38,9 @@ def cmd_source(process: Process) -> int:
     The sourced file is executed in the current shell environment.
     Variables and functions defined in the file persist after execution.
 
+    If FILENAME is a glob pattern (e.g. 'rc.d/*.sh'), every matching file
+    is sourced in sorted order and the exit status of the last one is returned.
+
     Arguments passed to source are available as $1, $2, etc. in the sourced file.
     The original positional parameters are restored after execution.
 
@@ -31,6 +49,7 @@ def cmd_source(process: Process) -> int:
         source lib.sh
         . ~/.bashrc
         source config.sh arg1 arg2
+        source 'rc.d/*.sh'
     """
     if not process.args:
         process.stderr.write("source: usage: source FILENAME [ARGUMENTS...]\n")
@@ -44,13 +63,20 @@ def cmd_source(process: Process) -> int:
     filename = process.args[0]
     script_args = process.args[1:] if len(process.args) > 1 else None
 
-    # Resolve the file path
-    if filename.startswith('/'):
-        file_path = filename
-    else:
-        # Relative path - resolve from current directory
-        file_path = os.path.join(shell.cwd, filename)
-        file_path = os.path.normpath(file_path)
+    # The shell leaves source's FILENAME glob unexpanded: source every
+    # matching file in-process
+    if '*' in filename or '?' in filename or '[' in filename:
+        matches = shell.glob_files(filename)
+        if matches:
+            result = 0
+            for match in matches:
+                result = shell.execute_script(match, script_args=script_args, silent=True)
+                if result is None:
+                    process.stderr.write(f"source: {match}: No such file or directory\n")
+                    result = 1
+            return result
+
+    file_path = _resolve_source_path(shell.cwd, filename)
 
     # Use shell.execute_script directly
     result = shell.execute_script(file_path, script_args=script_args, silent=True)
@@ -2,10 +2,30 @@
 TRUNCATE command - truncate file to specified size.
 """
 
+import re
 from ..process import Process
 from ..command_decorators import command
 from . import register_command
 
+# Exact option spellings, looked up once per option argument
+_OPTIONS = {
+    '-s': 'size',
+    '--size': 'size',
+    '-h': 'help',
+    '--help': 'help',
+    '--': 'end',
+}
+
+# Optional sign followed by ASCII digits; anything else is an invalid SIZE
+_SIZE_RE = re.compile(r'[+-]?[0-9]+')
+
+
+def _parse_size(size_str: str):
+    """Parse SIZE as an integer, returning None instead of raising if invalid"""
+    if _SIZE_RE.fullmatch(size_str) is None:
+        return None
+    return int(size_str)
+
 
 @command(needs_path_resolution=True)
 @register_command('truncate')
@@ -14,6 +34,7 @@ def cmd_truncate(process: Process) -> int:
     Truncate file to specified size
 
     Usage: truncate -s SIZE FILE...
+           truncate -sSIZE FILE...
            truncate --size=SIZE FILE...
 
     Options:
@@ -23,6 +44,7 @@ def cmd_truncate(process: Process) -> int:
     SIZE may be an integer number of bytes.
     If SIZE is less than current file size, extra data is lost.
     If SIZE is greater, file is extended with null bytes.
+    A FILE listed more than once is truncated only once.
 
     Examples:
       truncate -s 0 file.txt        # Truncate file to zero bytes (empty file)
@@ -33,73 +55,72 @@ def cmd_truncate(process: Process) -> int:
         process.stderr.write("truncate: filesystem not available\n")
         return 1
 
-    # Parse arguments
+    # Single ordered pass: the last SIZE wins and the first bad option
+    # is reported exactly as typed
     size = None
     files = []
-    i = 0
-    args = process.args
+    args = iter(process.args)
+    for arg in args:
+        if not arg.startswith('-'):
+            files.append(arg)
+            continue
 
-    while i < len(args):
-        arg = args[i]
-        
-        if arg in ('-h', '--help'):
-            process.stdout.write(cmd_truncate.__doc__ + "\n")
-            return 0
-        elif arg == '-s':
-            # -s SIZE format
-            if i + 1 >= len(args):
+        kind = _OPTIONS.get(arg)
+        if kind == 'size':
+            size_str = next(args, None)
+            if size_str is None:
                 process.stderr.write("truncate: option requires an argument -- 's'\n")
                 return 1
-            try:
-                size = int(args[i + 1])
-                if size < 0:
-                    process.stderr.write("truncate: invalid size: negative size not allowed\n")
-                    return 1
-            except ValueError:
-                process.stderr.write(f"truncate: invalid size: '{args[i + 1]}'\n")
-                return 1
-            i += 2
+        elif kind == 'help':
+            process.stdout.write(cmd_truncate.__doc__ + "\n")
+            return 0
+        elif kind == 'end':
+            files.extend(args)
+            break
         elif arg.startswith('--size='):
-            # --size=SIZE format
-            size_str = arg.split('=', 1)[1]
-            try:
-                size = int(size_str)
-                if size < 0:
-                    process.stderr.write("truncate: invalid size: negative size not allowed\n")
-                    return 1
-            except ValueError:
-                process.stderr.write(f"truncate: invalid size: '{size_str}'\n")
-                return 1
-            i += 1
-        elif arg.startswith('-'):
-            process.stderr.write(f"truncate: invalid option -- '{arg}'\n")
-            process.stderr.write("Try 'truncate --help' for more information.\n")
-            return 1
+            size_str = arg[7:]
+        elif arg.startswith('-s'):
+            # GNU-style attached -sSIZE
+            size_str = arg[2:]
         else:
-            # This is a file argument
-            files.append(arg)
-            i += 1
+            process.stderr.write(f"truncate: invalid option -- '{arg}'\n"
+                                 "Try 'truncate --help' for more information.\n")
+            return 1
+
+        size = _parse_size(size_str)
+        if size is None:
+            process.stderr.write(f"truncate: invalid size: '{size_str}'\n")
+            return 1
+        if size < 0:
+            process.stderr.write("truncate: invalid size: negative size not allowed\n")
+            return 1
 
     # Validate arguments
     if size is None:
-        process.stderr.write("truncate: you must specify a size\n")
-        process.stderr.write("Try 'truncate --help' for more information.\n")
+        process.stderr.write("truncate: you must specify a size\n"
+                             "Try 'truncate --help' for more information.\n")
         return 1
 
     if not files:
-        process.stderr.write("truncate: missing file operand\n")
-        process.stderr.write("Try 'truncate --help' for more information.\n")
+        process.stderr.write("truncate: missing file operand\n"
+                             "Try 'truncate --help' for more information.\n")
         return 1
 
-    # Truncate each file
-    exit_code = 0
+    # Drop repeated paths (e.g. from overlapping globs). A single SIZE
+    # applies to every file, so truncating a path twice changes nothing.
+    seen = set()
+    files = [p for p in files if not (p in seen or seen.add(p))]
+
+    # Truncate each file, then report per-path failures with a single write
+    errors = []
     for path in files:
         try:
             process.context.filesystem.client.truncate(path, size)
         except Exception as e:
-            error_msg = str(e)
-            process.stderr.write(f"truncate: {path}: {error_msg}\n")
-            exit_code = 1
+            errors.append(f"truncate: {path}: {e}\n")
+    if errors:
+        process.stderr.write("".join(errors))
+        return 1
 
-    return exit_code
+    return 0
 
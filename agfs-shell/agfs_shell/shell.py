@@ -33,7 +33,6 @@ from .path_manager import PathManager
 from .function_registry import FunctionRegistry
 from .alias_registry import AliasRegistry
 
-
 class _FunctionDictProxy(dict):
     """Proxy dict that syncs with FunctionRegistry.
 
@@ -858,10 +857,14 @@ class Shell:
         for cmd, args in commands:
             expanded_args = []
 
-            for arg in args:
+            for i, arg in enumerate(args):
                 # Skip flags (arguments starting with -)
                 if arg.startswith('-'):
                     expanded_args.append(arg)
+                # source expands a FILENAME glob itself and sources every
+                # match; expanding it here would source only the first
+                elif i == 0 and cmd in ('source', '.'):
+                    expanded_args.append(arg)
                 # Check if argument contains glob characters
                 elif '*' in arg or '?' in arg or '[' in arg:
                     # Try to expand the glob pattern
@@ -881,12 +884,34 @@ class Shell:
 
         return expanded_commands
 
-    def _match_glob_pattern(self, pattern: str):
+    def glob_files(self, pattern: str) -> List[str]:
+        """
+        Expand a glob pattern to regular files, as source does for FILENAME
+
+        Unlike argument globbing, directories are left out and, as in bash,
+        a name starting with '.' is matched only by a pattern that also
+        starts with '.'.
+
+        Args:
+            pattern: Glob pattern, absolute or relative to cwd (e.g. "rc.d/*.sh")
+
+        Returns:
+            Sorted list of matching file paths
+        """
+        return sorted(self._match_glob_pattern(pattern, files_only=True, skip_hidden=True))
+
+    def _match_glob_pattern(self, pattern: str, files_only: bool = False,
+                            skip_hidden: bool = False):
         """
         Match a glob pattern against files in the filesystem
 
+        Only the last path component may contain wildcards.
+
         Args:
-            pattern: Glob pattern (e.g., "*.txt", "/local/*.log")
+            pattern: Glob pattern (e.g., "*.txt", "/local/*.log", "rc.d/*.sh")
+            files_only: If True, leave directories out of the matches
+            skip_hidden: If True, names starting with '.' match only a
+                pattern that also starts with '.'
 
         Returns:
             List of matching file paths
@@ -897,11 +922,11 @@ class Shell:
         if pattern.startswith('/'):
             # Absolute pattern
             dir_path = os.path.dirname(pattern) or '/'
-            file_pattern = os.path.basename(pattern)
         else:
-            # Relative pattern
-            dir_path = self.cwd
-            file_pattern = pattern
+            # Relative pattern, possibly under a subdirectory of cwd
+            dir_path = os.path.normpath(os.path.join(self.cwd, os.path.dirname(pattern)))
+        file_pattern = os.path.basename(pattern)
+        skip_hidden = skip_hidden and not file_pattern.startswith('.')
 
         matches = []
 
@@ -910,13 +935,18 @@ class Shell:
             entries = self.filesystem.list_directory(dir_path)
 
             for entry in entries:
+                name = entry['name']
+                if skip_hidden and name.startswith('.'):
+                    continue
+                if files_only and (entry.get('isDir', False) or entry.get('type') == 'directory'):
+                    continue
                 # Match against pattern
-                if fnmatch.fnmatch(entry['name'], file_pattern):
+                if fnmatch.fnmatch(name, file_pattern):
                     # Build full path
                     if dir_path == '/':
-                        full_path = '/' + entry['name']
+                        full_path = '/' + name
                     else:
-                        full_path = dir_path + '/' + entry['name']
+                        full_path = dir_path + '/' + name
 
                     matches.append(full_path)
         except Exception:
@@ -1508,11 +1538,16 @@ class Shell:
         """
         # Check if file exists in AGFS
         try:
-            if not self.filesystem.file_exists(file_path):
-                return None
+            info = self.filesystem.get_file_info(file_path)
         except Exception:
             return None
 
+        # A directory can never be read as a script; fail on the stat alone
+        if info.get('isDir'):
+            if not silent:
+                sys.stderr.write(f"agfs-shell: {file_path}: Is a directory\n")
+            return 1
+
         # Read script content from AGFS
         try:
             content = self.filesystem.read_file(file_path)
@@ -163,14 +163,13 @@ class OutputStream(Stream):
 
     def write(self, data: Union[bytes, str]) -> int:
         """Write to stream and track last character"""
-        result = super().write(data)
+        # Encode once here rather than in Stream.write and again for tracking
+        if isinstance(data, str):
+            data = data.encode('utf-8')
         # Track last character for newline checking
         if data:
-            if isinstance(data, str):
-                data = data.encode('utf-8')
-            if len(data) > 0:
-                self._last_char = data[-1:]
-        return result
+            self._last_char = data[-1:]
+        return self.get_file().write(data)
 
     def ends_with_newline(self) -> bool:
         """Check if the last written data ended with a newline"""
@@ -1,14 +1,27 @@
 import unittest
-import tempfile
 import os
+from types import SimpleNamespace
 from unittest.mock import Mock
 from agfs_shell.builtins import BUILTINS
 from agfs_shell.process import Process
 from agfs_shell.streams import InputStream, OutputStream, ErrorStream
 
 class TestBuiltins(unittest.TestCase):
+    # Shared stdin fixtures, built once for the whole class
+    SORT_INPUT = "c\na\nb\n"
+    UNIQ_INPUT = "a\na\nb\nb\nc\n"
+    TWENTY_LINES = "\n".join(f"line{i}" for i in range(20)) + "\n"
+
+    @classmethod
+    def setUpClass(cls):
+        # Reading an empty stdin never changes it, so one instance serves every test
+        cls._empty_stdin = InputStream.from_string("")
+
     def create_process(self, command, args, input_data=""):
-        stdin = InputStream.from_string(input_data)
+        if input_data:
+            stdin = InputStream.from_string(input_data)
+        else:
+            stdin = self._empty_stdin
         stdout = OutputStream.to_buffer()
         stderr = ErrorStream.to_buffer()
         return Process(command, args, stdin, stdout, stderr)
@@ -35,14 +48,20 @@ class TestBuiltins(unittest.TestCase):
 
     def test_cat_file(self):
         cmd = BUILTINS['cat']
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filename = os.path.join(tmpdir, "test.txt")
-            with open(filename, "w") as f:
-                f.write("file content")
-            
-            proc = self.create_process("cat", [filename])
-            self.assertEqual(cmd(proc), 0)
-            self.assertEqual(proc.get_stdout(), b"file content")
+
+        # Serve the file from memory instead of writing it to disk
+        mock_fs = Mock()
+        files = {"/test/test.txt": [b"file ", b"content"]}
+
+        def mock_read_file(path, stream=False):
+            return iter(files[path])
+
+        mock_fs.read_file = mock_read_file
+
+        proc = self.create_process("cat", ["/test/test.txt"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 0)
+        self.assertEqual(proc.get_stdout(), b"file content")
 
     def test_grep(self):
         cmd = BUILTINS['grep']
@@ -80,7 +99,7 @@ class TestBuiltins(unittest.TestCase):
 
     def test_head(self):
         cmd = BUILTINS['head']
-        input_data = "\n".join([f"line{i}" for i in range(20)]) + "\n"
+        input_data = self.TWENTY_LINES
         
         # Default 10 lines
         proc = self.create_process("head", [], input_data)
@@ -98,7 +117,7 @@ class TestBuiltins(unittest.TestCase):
 
     def test_tail(self):
         cmd = BUILTINS['tail']
-        input_data = "\n".join([f"line{i}" for i in range(20)]) + "\n"
+        input_data = self.TWENTY_LINES
         
         # Default 10 lines
         proc = self.create_process("tail", [], input_data)
@@ -110,7 +129,7 @@ class TestBuiltins(unittest.TestCase):
 
     def test_sort(self):
         cmd = BUILTINS['sort']
-        input_data = "c\na\nb\n"
+        input_data = self.SORT_INPUT
         
         # Normal sort
         proc = self.create_process("sort", [], input_data)
@@ -124,7 +143,7 @@ class TestBuiltins(unittest.TestCase):
 
     def test_uniq(self):
         cmd = BUILTINS['uniq']
-        input_data = "a\na\nb\nb\nc\n"
+        input_data = self.UNIQ_INPUT
         
         proc = self.create_process("uniq", [], input_data)
         self.assertEqual(cmd(proc), 0)
@@ -148,9 +167,6 @@ class TestBuiltins(unittest.TestCase):
         """Test ls command with multiple file arguments (like from glob expansion)"""
         cmd = BUILTINS['ls']
 
-        # Create a mock filesystem
-        mock_fs = Mock()
-
         # Mock get_file_info to return file info for each path
         def mock_get_file_info(path):
             # Simulate file metadata
@@ -165,7 +181,8 @@ class TestBuiltins(unittest.TestCase):
             else:
                 raise Exception(f"No such file: {path}")
 
-        mock_fs.get_file_info = mock_get_file_info
+        # Plain namespace fake: ls only needs get_file_info here
+        mock_fs = SimpleNamespace(get_file_info=mock_get_file_info)
 
         # Test with multiple file paths (simulating glob expansion like 'ls *.txt')
         proc = self.create_process("ls", [
@@ -193,9 +210,6 @@ class TestBuiltins(unittest.TestCase):
         """Test ls command with mix of files and directories"""
         cmd = BUILTINS['ls']
 
-        # Create a mock filesystem
-        mock_fs = Mock()
-
         # Mock get_file_info to return file/dir info
         def mock_get_file_info(path):
             if path == "/test/dir1":
@@ -225,8 +239,11 @@ class TestBuiltins(unittest.TestCase):
             else:
                 raise Exception(f"Not a directory: {path}")
 
-        mock_fs.get_file_info = mock_get_file_info
-        mock_fs.list_directory = mock_list_directory
+        # Plain namespace fake: ls only needs these two callables here
+        mock_fs = SimpleNamespace(
+            get_file_info=mock_get_file_info,
+            list_directory=mock_list_directory,
+        )
 
         # Test with mix of file and directory
         proc = self.create_process("ls", [
@@ -281,6 +298,133 @@ class TestBuiltins(unittest.TestCase):
         self.assertIn(('/test/23_11_2025_11_43_36.wav', False), deleted_files)
         self.assertIn(('/test/23_11_2025_11_44_11.wav', False), deleted_files)
 
+    def test_truncate_multiple_files(self):
+        """Test truncate handles every file and reports per-file errors"""
+        cmd = BUILTINS['truncate']
+
+        mock_fs = Mock()
+        mock_client = Mock()
+        mock_fs.client = mock_client
+
+        truncated = []
+
+        def mock_truncate(path, size):
+            if path == "/test/missing.log":
+                raise Exception("No such file or directory")
+            truncated.append((path, size))
+
+        mock_client.truncate = mock_truncate
+
+        proc = self.create_process("truncate", ["-s", "0", "/test/a.log", "/test/b.log"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 0)
+        self.assertEqual(truncated, [("/test/a.log", 0), ("/test/b.log", 0)])
+
+        # A failing file is reported but does not stop the others
+        truncated.clear()
+        proc = self.create_process("truncate", ["--size=5", "/test/missing.log", "/test/a.log"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 1)
+        self.assertEqual(proc.get_stderr(), b"truncate: /test/missing.log: No such file or directory\n")
+        self.assertEqual(truncated, [("/test/a.log", 5)])
+
+        # Repeated paths are only truncated once, in first-seen order
+        truncated.clear()
+        proc = self.create_process("truncate", ["-s", "0", "/test/b.log", "/test/a.log", "/test/b.log"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 0)
+        self.assertEqual(truncated, [("/test/b.log", 0), ("/test/a.log", 0)])
+
+        # Operands after '--' are files even if they look like options
+        truncated.clear()
+        proc = self.create_process("truncate", ["--size", "7", "--", "-odd.log"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 0)
+        self.assertEqual(truncated, [("-odd.log", 7)])
+
+        # The last SIZE given wins
+        truncated.clear()
+        proc = self.create_process("truncate", ["-s", "1", "--size=2", "/test/a.log"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 0)
+        self.assertEqual(truncated, [("/test/a.log", 2)])
+
+        # GNU-style attached size
+        truncated.clear()
+        proc = self.create_process("truncate", ["-s5", "/test/a.log"])
+        proc.filesystem = mock_fs
+        self.assertEqual(cmd(proc), 0)
+        self.assertEqual(truncated, [("/test/a.log", 5)])
+
+    def test_truncate_invalid_size(self):
+        """Test truncate rejects malformed and negative sizes"""
+        cmd = BUILTINS['truncate']
+        mock_fs = Mock()
+
+        for args, error in [
+            (["-s", "abc", "/f"], b"truncate: invalid size: 'abc'\n"),
+            (["--size=", "/f"], b"truncate: invalid size: ''\n"),
+            (["--size=1.5", "/f"], b"truncate: invalid size: '1.5'\n"),
+            (["-s", "-5", "/f"], b"truncate: invalid size: negative size not allowed\n"),
+            (["-sabc", "/f"], b"truncate: invalid size: 'abc'\n"),
+            (["-s-5", "/f"], b"truncate: invalid size: negative size not allowed\n"),
+            (["--size=-1", "/f"], b"truncate: invalid size: negative size not allowed\n"),
+            (["/f", "-s"], b"truncate: option requires an argument -- 's'\n"),
+            (["-x", "-s", "0", "/f"],
+             b"truncate: invalid option -- '-x'\nTry 'truncate --help' for more information.\n"),
+            (["-z", "-a", "-s", "0", "/f"],
+             b"truncate: invalid option -- '-z'\nTry 'truncate --help' for more information.\n"),
+            (["-xy", "-s", "0", "/f"],
+             b"truncate: invalid option -- '-xy'\nTry 'truncate --help' for more information.\n"),
+            (["/f", "-x", "--help"],
+             b"truncate: invalid option -- '-x'\nTry 'truncate --help' for more information.\n"),
+            (["/f"], b"truncate: you must specify a size\nTry 'truncate --help' for more information.\n"),
+        ]:
+            proc = self.create_process("truncate", args)
+            proc.filesystem = mock_fs
+            self.assertEqual(cmd(proc), 1, args)
+            self.assertEqual(proc.get_stderr(), error)
+
+        mock_fs.client.truncate.assert_not_called()
+
+    def test_source_resolves_relative_path(self):
+        """Test source resolves relative filenames against the shell's cwd"""
+        cmd = BUILTINS['source']
+
+        mock_shell = Mock()
+        mock_shell.cwd = "/home/user"
+        mock_shell.execute_script.return_value = 0
+
+        proc = self.create_process("source", ["lib/env.sh", "arg1"])
+        proc.shell = mock_shell
+        self.assertEqual(cmd(proc), 0)
+        mock_shell.execute_script.assert_called_with(
+            "/home/user/lib/env.sh", script_args=["arg1"], silent=True)
+
+        proc = self.create_process("source", ["/etc/profile.as"])
+        proc.shell = mock_shell
+        self.assertEqual(cmd(proc), 0)
+        mock_shell.execute_script.assert_called_with(
+            "/etc/profile.as", script_args=None, silent=True)
+
+        # Missing file
+        mock_shell.execute_script.return_value = None
+        proc = self.create_process("source", ["missing.sh"])
+        proc.shell = mock_shell
+        self.assertEqual(cmd(proc), 1)
+        self.assertEqual(proc.get_stderr(), b"source: missing.sh: No such file or directory\n")
+
+    def test_source_path_resolution_matches_normpath(self):
+        """Test the source path fast path agrees with os.path.normpath"""
+        from agfs_shell.commands.source import _resolve_source_path
+
+        for cwd in ["/", "/home/user", "/home/user/"]:
+            for filename in ["lib.sh", "./lib.sh", "../lib.sh", "a/../b.sh", "a//b.sh",
+                             "a/./b.sh", "dir/", ".", "..", ".hidden.sh", "a/.."]:
+                expected = os.path.normpath(os.path.join(cwd, filename))
+                self.assertEqual(_resolve_source_path(cwd, filename), expected,
+                                 (cwd, filename))
+
     def test_cp_with_glob_pattern(self):
         """Test cp command with glob pattern (simulating shell glob expansion)"""
         cmd = BUILTINS['cp']
@@ -526,5 +526,70 @@ class TestLocalScopes:
             assert isinstance(shell.local_scopes, list)
 
 
+class TestScriptExecution:
+    """Test executing script files from AGFS."""
+
+    def test_execute_script_missing_file(self, mock_filesystem):
+        """Test missing scripts return None."""
+        from agfs_shell.shell import Shell
+
+        with patch('agfs_shell.shell.AGFSFileSystem', return_value=mock_filesystem):
+            shell = Shell()
+
+            assert shell.execute_script('/missing.sh', silent=True) is None
+
+    def test_execute_script_directory_skips_read(self, mock_filesystem):
+        """Test a directory fails on the stat without attempting a read."""
+        from agfs_shell.shell import Shell
+
+        mock_filesystem.metadata['/testdir']['isDir'] = True
+
+        with patch('agfs_shell.shell.AGFSFileSystem', return_value=mock_filesystem):
+            shell = Shell()
+
+            with patch.object(mock_filesystem, 'read_file') as read_file:
+                assert shell.execute_script('/testdir', silent=True) == 1
+                read_file.assert_not_called()
+
+    def test_source_glob_sources_all_matches(self, mock_filesystem):
+        """Test source with a glob pattern sources every match in sorted order."""
+        from agfs_shell.shell import Shell
+
+        mock_filesystem.create_directory('/rc.d')
+        mock_filesystem.write_file('/rc.d/20-b.sh', b'export ORDER="$ORDER b"\n')
+        mock_filesystem.write_file('/rc.d/10-a.sh', b'export ORDER="$ORDER a"\n')
+        mock_filesystem.write_file('/rc.d/README', b'export ORDER=broken\n')
+        mock_filesystem.write_file('/rc.d/.30-hidden.sh', b'export ORDER=hidden\n')
+        mock_filesystem.create_directory('/rc.d/40-dir.sh')
+
+        with patch('agfs_shell.shell.AGFSFileSystem', return_value=mock_filesystem):
+            shell = Shell()
+
+            assert shell.execute("source 'rc.d/*.sh'") == 0
+            assert shell.env.get('ORDER', '').split() == ['a', 'b']
+
+    def test_glob_relative_subdirectory(self, mock_filesystem):
+        """Test relative globs are matched inside their subdirectory."""
+        from agfs_shell.shell import Shell
+
+        mock_filesystem.create_directory('/rc.d')
+        mock_filesystem.write_file('/rc.d/a.sh', b'')
+        mock_filesystem.write_file('/rc.d/.hidden.sh', b'')
+        mock_filesystem.create_directory('/rc.d/sub.sh')
+        mock_filesystem.write_file('/top.sh', b'')
+
+        with patch('agfs_shell.shell.AGFSFileSystem', return_value=mock_filesystem):
+            shell = Shell()
+
+            # Argument globbing (ls, rm, cp, ...) still matches dotfiles and directories
+            assert sorted(shell._match_glob_pattern('rc.d/*.sh')) == [
+                '/rc.d/.hidden.sh', '/rc.d/a.sh', '/rc.d/sub.sh']
+            assert shell._match_glob_pattern('*.sh') == ['/top.sh']
+
+            # source's expansion keeps regular, non-hidden files only
+            assert shell.glob_files('rc.d/*.sh') == ['/rc.d/a.sh']
+            assert shell.glob_files('rc.d/.*.sh') == ['/rc.d/.hidden.sh']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])